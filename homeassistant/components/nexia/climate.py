@@ -351,9 +351,7 @@ class NexiaZone(NexiaThermostatZoneEntity, ClimateEntity):
     @property
     def extra_state_attributes(self):
         """Return the device specific state attributes."""
-        data = super().extra_state_attributes
-
-        data[ATTR_ZONE_STATUS] = self._zone.get_status()
+        data = {ATTR_ZONE_STATUS: self._zone.get_status()}
 
         if not self._has_relative_humidity:
             return data
@@ -1,8 +1,10 @@
 """The nexia integration base entity."""
+import sys
+
 from nexia.thermostat import NexiaThermostat
 from nexia.zone import NexiaThermostatZone
 
-from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -23,30 +25,16 @@ from .coordinator import NexiaDataUpdateCoordinator
 class NexiaEntity(CoordinatorEntity):
     """Base class for nexia entities."""
 
+    coordinator: NexiaDataUpdateCoordinator
+    _attr_attribution = ATTRIBUTION
+
     def __init__(
         self, coordinator: NexiaDataUpdateCoordinator, name: str, unique_id: str
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._unique_id = unique_id
-        self._name = name
-
-    @property
-    def unique_id(self):
-        """Return the unique id."""
-        return self._unique_id
-
-    @property
-    def name(self):
-        """Return the name."""
-        return self._name
-
-    @property
-    def extra_state_attributes(self):
-        """Return the device specific state attributes."""
-        return {
-            ATTR_ATTRIBUTION: ATTRIBUTION,
-        }
+        self._attr_unique_id = unique_id
+        self._attr_name = name
 
 
 class NexiaThermostatEntity(NexiaEntity):
@@ -56,18 +44,17 @@ class NexiaThermostatEntity(NexiaEntity):
         """Initialize the entity."""
         super().__init__(coordinator, name, unique_id)
         self._thermostat: NexiaThermostat = thermostat
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device_info of the device."""
-        assert isinstance(self.coordinator, NexiaDataUpdateCoordinator)
-        return DeviceInfo(
+        # Entities on the same thermostat or zone share one interned signal
+        self._thermostat_signal = sys.intern(
+            f"{SIGNAL_THERMOSTAT_UPDATE}-{thermostat.thermostat_id}"
+        )
+        self._attr_device_info = DeviceInfo(
             configuration_url=self.coordinator.nexia_home.root_url,
-            identifiers={(DOMAIN, self._thermostat.thermostat_id)},
+            identifiers={(DOMAIN, thermostat.thermostat_id)},
             manufacturer=MANUFACTURER,
-            model=self._thermostat.get_model(),
-            name=self._thermostat.get_name(),
-            sw_version=self._thermostat.get_firmware(),
+            model=thermostat.get_model(),
+            name=thermostat.get_name(),
+            sw_version=thermostat.get_firmware(),
         )
 
     async def async_added_to_hass(self):
@@ -76,11 +63,12 @@ class NexiaThermostatEntity(NexiaEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_THERMOSTAT_UPDATE}-{self._thermostat.thermostat_id}",
+                self._thermostat_signal,
                 self.async_write_ha_state,
             )
         )
 
+    @callback
     def _signal_thermostat_update(self):
         """Signal a thermostat update.
 
@@ -90,9 +78,7 @@ class NexiaThermostatEntity(NexiaEntity):
 
         Update all the zones on the thermostat.
         """
-        async_dispatcher_send(
-            self.hass, f"{SIGNAL_THERMOSTAT_UPDATE}-{self._thermostat.thermostat_id}"
-        )
+        async_dispatcher_send(self.hass, self._thermostat_signal)
 
 
 class NexiaThermostatZoneEntity(NexiaThermostatEntity):
@@ -102,21 +88,19 @@ class NexiaThermostatZoneEntity(NexiaThermostatEntity):
         """Initialize the entity."""
         super().__init__(coordinator, zone.thermostat, name, unique_id)
         self._zone: NexiaThermostatZone = zone
-
-    @property
-    def device_info(self):
-        """Return the device_info of the device."""
-        data = super().device_info
-        zone_name = self._zone.get_name()
-        data.update(
-            {
-                "identifiers": {(DOMAIN, self._zone.zone_id)},
-                "name": zone_name,
-                "suggested_area": zone_name,
-                "via_device": (DOMAIN, self._zone.thermostat.thermostat_id),
-            }
+        self._zone_signal = sys.intern(f"{SIGNAL_ZONE_UPDATE}-{zone.zone_id}")
+        zone_name = zone.get_name()
+        thermostat = zone.thermostat
+        self._attr_device_info = DeviceInfo(
+            configuration_url=self.coordinator.nexia_home.root_url,
+            identifiers={(DOMAIN, zone.zone_id)},
+            manufacturer=MANUFACTURER,
+            model=thermostat.get_model(),
+            name=zone_name,
+            suggested_area=zone_name,
+            sw_version=thermostat.get_firmware(),
+            via_device=(DOMAIN, thermostat.thermostat_id),
         )
-        return data
 
     async def async_added_to_hass(self):
         """Listen for signals for services."""
@@ -124,11 +108,12 @@ class NexiaThermostatZoneEntity(NexiaThermostatEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{SIGNAL_ZONE_UPDATE}-{self._zone.zone_id}",
+                self._zone_signal,
                 self.async_write_ha_state,
             )
         )
 
+    @callback
     def _signal_zone_update(self):
         """Signal a zone update.
 
@@ -137,4 +122,4 @@ class NexiaThermostatZoneEntity(NexiaThermostatEntity):
 
         Update a single zone.
         """
-        async_dispatcher_send(self.hass, f"{SIGNAL_ZONE_UPDATE}-{self._zone.zone_id}")
+        async_dispatcher_send(self.hass, self._zone_signal)
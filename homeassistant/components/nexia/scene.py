@@ -53,9 +53,7 @@ class NexiaAutomationScene(NexiaEntity, Scene):
     @property
     def extra_state_attributes(self):
         """Return the scene specific state attributes."""
-        data = super().extra_state_attributes
-        data[ATTR_DESCRIPTION] = self._automation.description
-        return data
+        return {ATTR_DESCRIPTION: self._automation.description}
 
     @property
     def icon(self):
@@ -83,7 +83,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Fetch initial data, retry on failed poll
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        coordinator.shutdown()
+        raise
 
     # Create the Ws66iData data class save it to hass
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = Ws66iData(
@@ -97,6 +101,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     def shutdown(event):
         """Close the WS66i connection to the amplifier and save snapshots."""
         ws66i.close()
+        coordinator.shutdown()
 
     entry.async_on_unload(entry.add_update_listener(_update_listener))
     entry.async_on_unload(
@@ -112,9 +117,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        ws66i: WS66i = hass.data[DOMAIN][entry.entry_id].device
-        ws66i.close()
-        hass.data[DOMAIN].pop(entry.entry_id)
+        ws66i_data: Ws66iData = hass.data[DOMAIN].pop(entry.entry_id)
+        ws66i_data.device.close()
+        ws66i_data.coordinator.shutdown()
 
     return unload_ok
 
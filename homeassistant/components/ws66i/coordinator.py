@@ -1,17 +1,34 @@
 """Coordinator for WS66i."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import logging
 
 from pyws66i import WS66i, ZoneStatus
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 _LOGGER = logging.getLogger(__name__)
 
 POLL_INTERVAL = timedelta(seconds=30)
+# Poll less often once this many polls in a row found no zone changes
+IDLE_POLL_COUNT = 5
+IDLE_POLL_INTERVAL = timedelta(seconds=120)
+
+
+def _zone_state(status: ZoneStatus) -> tuple[bool, bool, int, int, int, int, int]:
+    """Return the zone settings that can be changed on the amplifier."""
+    return (
+        status.power,
+        status.mute,
+        status.volume,
+        status.treble,
+        status.bass,
+        status.balance,
+        status.source,
+    )
 
 
 class Ws66iDataUpdateCoordinator(DataUpdateCoordinator):
@@ -32,12 +49,21 @@ class Ws66iDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self._ws66i = my_api
         self._zones = zones
+        self._stable_polls = 0
+        # Poll on a dedicated thread so updates do not queue behind other
+        # integrations in the shared executor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ws66i")
+        self._is_shutdown = False
 
     def _update_all_zones(self) -> list[ZoneStatus]:
         """Fetch data for each of the zones."""
+        # pyws66i serializes every request over a single telnet connection,
+        # so the zones are polled back to back in one executor job instead
+        # of paying for a thread hop per zone.
+        zone_status = self._ws66i.zone_status
         data = []
         for zone_id in self._zones:
-            data_zone = self._ws66i.zone_status(zone_id)
+            data_zone = zone_status(zone_id)
             if data_zone is None:
                 raise UpdateFailed(f"Failed to update zone {zone_id}")
 
@@ -50,4 +76,56 @@ class Ws66iDataUpdateCoordinator(DataUpdateCoordinator):
         """Fetch data for each of the zones."""
         # HA will call my entity's _handle_coordinator_update()
         # The data I pass back here can be accessed through coordinator.data.
-        return await self.hass.async_add_executor_job(self._update_all_zones)
+        if self._is_shutdown:
+            raise UpdateFailed("The WS66i connection has been shut down")
+
+        data = await self.hass.loop.run_in_executor(
+            self._executor, self._update_all_zones
+        )
+
+        # Hand back the previous objects when no zone changed so the
+        # entities can tell that there is no new state to write
+        if (
+            self.last_update_success
+            and self.data is not None
+            and all(
+                _zone_state(new) == _zone_state(old)
+                for new, old in zip(data, self.data)
+            )
+        ):
+            data = self.data
+
+        # Back off while nothing changes and resume normal polling on a change
+        if data is self.data:
+            self._stable_polls += 1
+            if self._stable_polls >= IDLE_POLL_COUNT:
+                self._set_update_interval(IDLE_POLL_INTERVAL)
+        else:
+            self._stable_polls = 0
+            self._set_update_interval(POLL_INTERVAL)
+
+        return data
+
+    @callback
+    def _set_update_interval(self, update_interval: timedelta) -> bool:
+        """Change the poll interval unless polling was stopped.
+
+        Return True if the interval was changed.
+        """
+        if self.update_interval is None or self.update_interval == update_interval:
+            return False
+        self.update_interval = update_interval
+        return True
+
+    @callback
+    def async_note_user_action(self) -> None:
+        """Resume normal polling after a command was sent to the amplifier."""
+        self._stable_polls = 0
+        if self._set_update_interval(POLL_INTERVAL) and self._listeners:
+            # Replace the pending idle poll with one at the normal interval
+            self._schedule_refresh()
+
+    def shutdown(self) -> None:
+        """Shut down the polling executor without waiting for it."""
+        self._is_shutdown = True
+        self._executor.shutdown(wait=False)
@@ -110,8 +110,13 @@ class Ws66iZone(CoordinatorEntity, MediaPlayerEntity):
         # This will be called for each of the entities after the coordinator
         # finishes executing _async_update_data()
 
+        status = self.coordinator.data[self._zone_id_idx]
+        if status is self._status and self.coordinator.last_update_success:
+            # The coordinator kept the previous data, nothing changed
+            return
+
         # Save a reference to the zone status that this entity represents
-        self._status = self.coordinator.data[self._zone_id_idx]
+        self._status = status
         self._set_attrs_from_status()
 
         # Parent will notify HA of the update
@@ -128,6 +133,7 @@ class Ws66iZone(CoordinatorEntity, MediaPlayerEntity):
 
     @callback
     def _async_update_attrs_write_ha_state(self) -> None:
+        self._coordinator.async_note_user_action()
         self._set_attrs_from_status()
         self.async_write_ha_state()
 
@@ -3,8 +3,9 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 import datetime
+import io
 from typing import Any, Generator, TypeVar
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 from gcal_sync.auth import API_BASE_URL
 from oauth2client.client import Credentials, OAuth2Credentials
@@ -15,6 +16,7 @@ from homeassistant.components.google import CONF_TRACK_NEW, DOMAIN
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry
@@ -26,6 +28,11 @@ _T = TypeVar("_T")
 YieldFixture = Generator[_T, None, None]
 
 
+# Set our timezone to CST/Regina so we can check calculations
+# This keeps UTC-6 all year round
+TEST_TIME_ZONE = "America/Regina"
+_TEST_TZINFO = dt_util.get_time_zone(TEST_TIME_ZONE)
+
 CALENDAR_ID = "qwertyuiopasdfghjklzxcvbnm@import.calendar.google.com"
 
 # Entities can either be created based on data directly from the API, or from
@@ -53,6 +60,19 @@ TEST_API_CALENDAR = {
     "defaultReminders": [],
 }
 
+# Prefer the libyaml emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Token fields stored in the config entry that do not vary between tests
+TEST_TOKEN = {
+    "access_token": "ACCESS_TOKEN",
+    "refresh_token": "REFRESH_TOKEN",
+    "token_type": "Bearer",
+}
+
+# Serialized calendar yaml keyed by the repr of the calendars config
+_YAML_CACHE: dict[str, str] = {}
+
 
 @pytest.fixture
 def test_api_calendar():
@@ -99,14 +119,19 @@ def calendars_config(calendars_config_entity: dict[str, Any]) -> list[dict[str,
     ]
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def mock_calendars_yaml(
     hass: HomeAssistant,
     calendars_config: list[dict[str, Any]],
 ) -> None:
     """Fixture that prepares the google_calendars.yaml mocks."""
-    mocked_open_function = mock_open(read_data=yaml.dump(calendars_config))
-    with patch("homeassistant.components.google.open", mocked_open_function):
+    key = repr(calendars_config)
+    if (read_data := _YAML_CACHE.get(key)) is None:
+        read_data = _YAML_CACHE[key] = yaml.dump(calendars_config, Dumper=_YAML_DUMPER)
+    with patch(
+        "homeassistant.components.google.open",
+        lambda *args, **kwargs: io.StringIO(read_data),
+    ):
         yield
 
 
@@ -180,10 +205,8 @@ def config_entry(
         data={
             "auth_implementation": "device_auth",
             "token": {
-                "access_token": "ACCESS_TOKEN",
-                "refresh_token": "REFRESH_TOKEN",
+                **TEST_TOKEN,
                 "scope": " ".join(token_scopes),
-                "token_type": "Bearer",
                 "expires_at": config_entry_token_expiry,
             },
         },
@@ -269,9 +292,8 @@ def mock_insert_event(
 @pytest.fixture(autouse=True)
 def set_time_zone(hass):
     """Set the time zone for the tests."""
-    # Set our timezone to CST/Regina so we can check calculations
-    # This keeps UTC-6 all year round
-    hass.config.set_time_zone("America/Regina")
+    hass.config.time_zone = TEST_TIME_ZONE
+    dt_util.set_default_time_zone(_TEST_TZINFO)
 
 
 @pytest.fixture
@@ -296,7 +318,9 @@ def config(google_config: dict[str, Any]) -> dict[str, Any]:
 
 
 @pytest.fixture
-def component_setup(hass: HomeAssistant, config: dict[str, Any]) -> ComponentSetup:
+def component_setup(
+    hass: HomeAssistant, config: dict[str, Any], mock_calendars_yaml: None
+) -> ComponentSetup:
     """Fixture for setting up the integration."""
 
     async def _setup_func() -> bool:
@@ -1,6 +1,12 @@
 """The switch tests for the nexia platform."""
+from unittest.mock import patch
 
-from homeassistant.const import STATE_ON
+from nexia.zone import NexiaThermostatZone
+
+from homeassistant.components.nexia.const import SIGNAL_ZONE_UPDATE
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .util import async_init_integration
 
@@ -9,3 +15,16 @@ async def test_hold_switch(hass):
     """Test creation of the hold switch."""
     await async_init_integration(hass)
     assert hass.states.get("switch.nick_office_hold").state == STATE_ON
+
+
+async def test_hold_switch_zone_signal(hass):
+    """Test a zone update signal writes the state of the hold switch."""
+    await async_init_integration(hass)
+    entity_registry = er.async_get(hass)
+    zone_id = entity_registry.async_get("switch.nick_office_hold").unique_id
+
+    with patch.object(NexiaThermostatZone, "is_in_permanent_hold", return_value=False):
+        async_dispatcher_send(hass, f"{SIGNAL_ZONE_UPDATE}-{zone_id}")
+        await hass.async_block_till_done()
+
+    assert hass.states.get("switch.nick_office_hold").state == STATE_OFF
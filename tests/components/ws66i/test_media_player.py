@@ -1,5 +1,6 @@
 """The tests for WS66i Media player platform."""
 from collections import defaultdict
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -24,8 +25,14 @@ from homeassistant.components.ws66i.const import (
     SERVICE_RESTORE,
     SERVICE_SNAPSHOT,
 )
+from homeassistant.components.ws66i.coordinator import (
+    IDLE_POLL_COUNT,
+    IDLE_POLL_INTERVAL,
+    POLL_INTERVAL,
+)
 from homeassistant.const import (
     CONF_IP_ADDRESS,
+    EVENT_HOMEASSISTANT_STOP,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     SERVICE_VOLUME_DOWN,
@@ -37,6 +44,7 @@ from homeassistant.const import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from tests.common import MockConfigEntry
 
@@ -368,6 +376,89 @@ async def test_update(hass):
     assert state.attributes[ATTR_INPUT_SOURCE] == "three"
 
 
+async def test_update_unchanged(hass):
+    """Test that a poll without changes keeps the previous data."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+
+    ws66i_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = ws66i_data.coordinator
+    data = coordinator.data
+
+    with patch(
+        "homeassistant.components.ws66i.media_player.Ws66iZone.async_write_ha_state"
+    ) as write_state:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert coordinator.data is data
+    assert not write_state.called
+
+    ws66i.set_volume(11, 38)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.data is not data
+    state = hass.states.get(ZONE_1_ID)
+    assert state.attributes[ATTR_MEDIA_VOLUME_LEVEL] == 1.0
+
+
+async def test_update_idle_poll_interval(hass):
+    """Test that polling slows down while the zones are idle."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+
+    ws66i_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = ws66i_data.coordinator
+
+    for _ in range(IDLE_POLL_COUNT - 1):
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == POLL_INTERVAL
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == IDLE_POLL_INTERVAL
+
+    ws66i.set_volume(11, 38)
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == POLL_INTERVAL
+
+
+async def test_user_action_resets_poll_interval(hass):
+    """Test that a service call resumes normal polling."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+
+    ws66i_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = ws66i_data.coordinator
+
+    for _ in range(IDLE_POLL_COUNT):
+        await coordinator.async_refresh()
+    assert coordinator.update_interval == IDLE_POLL_INTERVAL
+
+    await _call_media_player_service(
+        hass, SERVICE_VOLUME_SET, {"entity_id": ZONE_1_ID, "volume_level": 1.0}
+    )
+    assert coordinator.update_interval == POLL_INTERVAL
+
+    # The poll after the command matches the state the entity already wrote
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == POLL_INTERVAL
+
+
+async def test_poll_interval_kept_after_stop(hass):
+    """Test that a refresh does not restart polling once it was stopped."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+
+    ws66i_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = ws66i_data.coordinator
+    coordinator.update_interval = None
+
+    ws66i.set_volume(11, 38)
+    await coordinator.async_refresh()
+    assert coordinator.update_interval is None
+
+
 async def test_failed_update(hass):
     """Test updating failure from ws66i."""
     ws66i = MockWs66i()
@@ -637,6 +728,60 @@ async def test_unload_config_entry(hass):
     assert not hass.data[DOMAIN]
 
 
+async def test_update_runs_on_dedicated_thread(hass):
+    """Test that zones are polled on the WS66i executor thread."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+
+    thread_names = []
+    zone_status = ws66i.zone_status
+
+    def _zone_status(zone_id):
+        thread_names.append(threading.current_thread().name)
+        return zone_status(zone_id)
+
+    with patch.object(ws66i, "zone_status", _zone_status):
+        await coordinator.async_refresh()
+
+    assert thread_names
+    assert all(name.startswith("ws66i") for name in thread_names)
+
+
+async def test_no_update_after_unload(hass):
+    """Test that refreshing after unload fails cleanly."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+
+    await config_entry.async_unload(hass)
+    await hass.async_block_till_done()
+
+    with patch.object(ws66i, "zone_status") as zone_status:
+        await coordinator.async_refresh()
+
+    assert not zone_status.called
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+
+
+async def test_no_update_after_stop(hass):
+    """Test that refreshing after Home Assistant stops fails cleanly."""
+    ws66i = MockWs66i()
+    config_entry = await _setup_ws66i_with_options(hass, ws66i)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    with patch.object(ws66i, "zone_status") as zone_status:
+        await coordinator.async_refresh()
+
+    assert not zone_status.called
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+
+
 async def test_restore_snapshot_on_reconnect(hass):
     """Test restoring a saved snapshot when reconnecting to amp."""
     ws66i = MockWs66i()